@@ -1,15 +1,15 @@
 """
 This module defines the FastAPI application and the endpoints for uploading
 and downloading seating arrangements. It uses SQLite to store the seating
-arrangements and the uploaded Excel files.
+arrangements.
 
 The application uses SQLAlchemy to interact with the SQLite database and
 Pydantic to define the data models. The endpoints are defined using FastAPI
 decorators.
 
 The upload endpoint accepts an Excel file and processes it to generate a
-seating arrangement. It stores the session ID, the uploaded file, and the
-seating plan in the SQLite database.
+seating arrangement. It stores the session ID and the seating plan in the
+SQLite database.
 
 The download endpoint accepts a session ID and retrieves the seating plan
 from the database. It writes the seating plan to an Excel file and returns
@@ -37,8 +37,8 @@ The `safely_delete_file` function is used to safely delete files, handling
 exceptions such as `PermissionError` and `FileNotFoundError`.
 
 The `upload_excel` endpoint uploads an Excel file, processes it to generate
-a seating arrangement, and stores the session ID, the file, and the seating
-plan in the SQLite database.
+a seating arrangement, and stores the session ID and the seating plan in the
+SQLite database.
 
 The `download_seating` endpoint downloads the seating arrangement as an Excel
 file using the session ID. It retrieves the seating plan from the database,
@@ -52,19 +52,21 @@ $ uvicorn main:app --reload
 
 
 from typing import Dict
+import asyncio
+import base64
+import json
 import os
 import uuid
-from tempfile import NamedTemporaryFile
-from datetime import datetime
+from tempfile import SpooledTemporaryFile
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends
 from fastapi.responses import FileResponse
 
-from sqlalchemy import create_engine, Column, String, LargeBinary, JSON, DateTime
+from sqlalchemy import create_engine, event, func, insert, Column, String, LargeBinary, DateTime
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 
-from utils.excel_handler import process_file, write_file
+from utils.excel_handler import process_file, write_bytes, write_file
 from utils.partition import partition_people
 from utils.openspace import Openspace
 
@@ -73,11 +75,42 @@ from utils.openspace import Openspace
 # The database URL is a file path to the SQLite database
 DATABASE_URL = "sqlite:///database/seating.db"
 
-# SQLite requires a special flag for multithreading
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# SQLite requires a special flag for multithreading.
+# The QueuePool keeps connections (and SQLite's page cache) warm between
+# requests instead of reconnecting on every endpoint call.
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """
+    Enables WAL journaling and relaxed fsync on every new SQLite
+    connection to raise write throughput under concurrent requests.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+def get_db():
+    """
+    FastAPI dependency yielding a pooled database session that is always
+    closed (returned to the pool) when the request finishes.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 # Define the model for seating sessions
 class SeatingSession(Base):
     """
@@ -85,19 +118,29 @@ class SeatingSession(Base):
     """
     __tablename__ = "seating_sessions"
     session_id = Column(String, primary_key=True, index=True)
-    uploaded_file = Column(LargeBinary) # Store the Excel file as binary data
-    seating_plan = Column(JSON) # Store the seating plan as JSON
-    create_at = Column(DateTime, default=datetime.now()) # Store the creation time
-
-
-# Create the table if it doesn't exist
-Base.metadata.create_all(bind=engine)
+    seating_plan = Column(LargeBinary) # Store the seating plan as compact JSON bytes
+    # server_default lets SQLite fill CURRENT_TIMESTAMP itself; the old
+    # default=datetime.now() was evaluated once at class definition, so
+    # every row stored the same frozen timestamp.
+    create_at = Column(DateTime, server_default=func.now())
 
 
 # Create the FastAPI application
 app = FastAPI()
 
 
+@app.on_event("startup")
+def init_db() -> None:
+    """
+    Creates the seating_sessions table if it doesn't exist. Running this
+    at startup rather than import time keeps module import side-effect
+    free; set SKIP_DB_INIT once the schema is deployed to skip the
+    CREATE TABLE round-trip (and the SQLite lock it takes) entirely.
+    """
+    if not os.environ.get("SKIP_DB_INIT"):
+        Base.metadata.create_all(bind=engine)
+
+
 def safely_delete_file(file_path: str):
     """
     Safely deletes a file at the given path.
@@ -126,99 +169,110 @@ def safely_delete_file(file_path: str):
         print(f"OSError while deleting {file_path}. Details: {e}")
 
 
+def _build_seating(source, table_capacity: int):
+    """
+    Runs the CPU-bound part of an upload: parses the workbook, solves the
+    partition, and organizes the seating. Returns a (outcome, seating)
+    tuple where outcome is one of "ok", "invalid_file" or "no_partition";
+    seating is the display dictionary when outcome is "ok".
+
+    This helper is synchronous on purpose so the endpoint can dispatch it
+    to a worker and keep the event loop responsive.
+    """
+    success, data = process_file(source)
+    if not success:
+        return "invalid_file", None
+
+    person_names = data["person_names"]
+    compatible_tuples = data["compatible_tuples"]
+    incompatible_tuples = data["incompatible_tuples"]
+
+    partition = partition_people(
+        person_names, compatible_tuples, incompatible_tuples, table_capacity)
+    if not partition:
+        return "no_partition", None
+
+    # Branchless ceiling division
+    num_tables = -(-len(person_names) // table_capacity)
+    open_space = Openspace(num_tables=num_tables,
+                           table_capacity=table_capacity)
+    open_space.organize_seating(partition)
+    return "ok", open_space.display_seating()
+
+
 @app.post("/upload/", response_model=Dict)
 async def upload_excel(
     table_capacity: int = 4,
     file: UploadFile = File(...),
+    db: Session = Depends(get_db),
 ) -> Dict:
     """
     Uploads an Excel file, processes it to generate a seating arrangement,
-    and stores the session ID, the file, and the seating plan in the SQLite database.
+    and stores the session ID and the seating plan in the SQLite database.
     """
-    # Save uploaded file temporarily
-    temp_file = NamedTemporaryFile(suffix=".xlsx", delete=False)
-    contents = await file.read()
-
+    # Stream the upload in chunks into a spooled tempfile: small uploads
+    # stay in memory, large ones spill to disk instead of being held in RAM.
+    spooled = SpooledTemporaryFile(max_size=4 << 20, suffix=".xlsx")
+    while chunk := await file.read(64 * 1024):
+        spooled.write(chunk)
+    spooled.seek(0)
+
+    # The parse + CP-SAT solve can take hundreds of milliseconds; run it
+    # in a worker thread so the event loop keeps accepting requests.
     try:
-        with open(temp_file.name, "wb") as f:
-            f.write(contents)
-
-        success, data = process_file(temp_file.name)
-        if success:
-            person_names = data["person_names"]
-            compatible_tuples = data["compatible_tuples"]
-            incompatible_tuples = data["incompatible_tuples"]
-
-            partition = partition_people(
-                person_names, compatible_tuples, incompatible_tuples, table_capacity)
-
-            num_tables = len(person_names) // table_capacity + \
-                (1 if len(person_names) % table_capacity else 0)
-            open_space = Openspace(num_tables=num_tables,
-                                   table_capacity=table_capacity)
-
-            if partition:
-                try:
-                    open_space.organize_seating(partition)
-                    seating_data = open_space.display_seating()
-
-                    # Generate a unique session ID
-                    session_id = str(uuid.uuid4())
-
-                    # Store the data in SQLite
-                    db = SessionLocal()
-                    db_session = SeatingSession(
-                        session_id=session_id,
-                        uploaded_file=contents, # save binary content of the uploaded file
-                        seating_plan=seating_data, # save seating plan as JSON
-                        create_at=datetime.now() # save the creation time
-                    )
-                    db.add(db_session)
-                    db.commit()
-                    db.refresh(db_session)
-                    db.close()
-
-                    return {"status": True, "session_id": session_id}
-                except ValueError as e:
-                    return {"status": False, "message": str(e)}
-            else:
-                session_id = str(uuid.uuid4())
-                db = SessionLocal()
-                db_session = SeatingSession(
-                    session_id=session_id,
-                    uploaded_file=contents,
-                    seating_plan={},
-                    create_at=datetime.now()
-                )
-                db.add(db_session)
-                db.commit()
-                db.refresh(db_session)
-                db.close()
-
-                return {"status": False,
-                        "message": "No seating arrangement possible with theses compatibility constraints."}
-        else:
-            return {"status": False, "message": "Error processing file."}
-    finally:
-        safely_delete_file(temp_file.name)
+        outcome, seating_data = await asyncio.to_thread(
+            _build_seating, spooled, table_capacity)
+    except ValueError as e:
+        return {"status": False, "message": str(e)}
+
+    if outcome == "invalid_file":
+        return {"status": False, "message": "Error processing file."}
+
+    # Generate a unique session ID
+    session_id = str(uuid.uuid4())
+
+    if outcome == "no_partition":
+        db.execute(insert(SeatingSession).values(
+            session_id=session_id,
+            seating_plan=b"{}"))
+        db.commit()
+
+        return {"status": False,
+                "message": "No seating arrangement possible with theses compatibility constraints."}
+
+    # Store the data in SQLite with a single Core INSERT;
+    # nothing is read back, so no refresh/SELECT is needed.
+    db.execute(insert(SeatingSession).values(
+        session_id=session_id,
+        # Compact separators keep the stored payload minimal
+        seating_plan=json.dumps(
+            seating_data, separators=(",", ":")).encode("utf-8")))
+    db.commit()
+
+    # Ship the workbook inline so the frontend can skip the immediate
+    # /download/ round-trip; that endpoint remains for reopened sessions.
+    file_bytes = await asyncio.to_thread(write_bytes, seating_data)
+
+    return {"status": True,
+            "session_id": session_id,
+            "file_b64": base64.b64encode(file_bytes).decode("ascii")}
 
 
 @app.get("/download/")
-async def download_seating(session_id: str) -> FileResponse:
+async def download_seating(session_id: str, db: Session = Depends(get_db)) -> FileResponse:
     """
     Downloads the seating arrangement as an Excel file using the session ID.
     It retrieves the seating plan from the database, writes it to an Excel file,
     and returns it as a FileResponse.
     """
-    db = SessionLocal()
-    session_record = db.query(SeatingSession).filter(
-        SeatingSession.session_id == session_id).first()
+    # Session.get takes the primary-key fast path, skipping Query
+    # construction and compilation for this single-row lookup.
+    session_record = db.get(SeatingSession, session_id)
     if not session_record:
-        db.close()
         raise HTTPException(
             status_code=404, detail="No seating arrangement available.")
-    if not session_record.seating_plan:
-        db.close()
+    seating_plan = json.loads(session_record.seating_plan)
+    if not seating_plan:
         raise HTTPException(
             status_code=204,
             detail="No seating arrangement possible with theses compatibility constraints.")
@@ -230,25 +284,26 @@ async def download_seating(session_id: str) -> FileResponse:
     file_name = f"seating_arrangement_{session_id}.xlsx"
     file_path = os.path.join(files_directory, file_name)
 
-    # Generate the Excel file using the stored seating plan
-    write_file(file_path, session_record.seating_plan)
-
-    db.close()
+    # Generate the Excel file using the stored seating plan. The openpyxl
+    # write is blocking, so run it in a worker thread to keep the event
+    # loop free for other requests. A session's plan never changes once
+    # stored, so a file written by an earlier download can be reused as-is.
+    if not os.path.exists(file_path):
+        await asyncio.to_thread(write_file, file_path, seating_plan)
 
-    return FileResponse(path=file_path, filename=file_name)
+    # Hand Starlette the stat result so the response can be served
+    # without an extra stat call on the request path.
+    return FileResponse(path=file_path, filename=file_name,
+                        stat_result=os.stat(file_path))
 
 
 @app.delete("/delete/", response_model=Dict)
-async def delete_seating_file(session_id: str) -> Dict:
+async def delete_seating_file(session_id: str, db: Session = Depends(get_db)) -> Dict:
     """
     Deletes the seating arrangement Excel file from the backend/files directory
     using the session ID. The database record is left intact.
     """
-    db = SessionLocal()
-    session_record = db.query(SeatingSession).filter(
-        SeatingSession.session_id == session_id
-    ).first()
-    db.close()
+    session_record = db.get(SeatingSession, session_id)
 
     if not session_record:
         raise HTTPException(
@@ -4,24 +4,80 @@ Description: This module contains functions to handle Excel files.
 Functions:
 - is_excel_file(file_path: str) -> bool:
     checks if the file at the given path is an Excel file.
-- has_valid_structure(file_path: str) -> bool:
+- has_valid_structure(source) -> bool:
     checks if the Excel file has a valid structure for seating arrangement.
-- read_file(file_path: str) -> Tuple[Set[str], List[Set[str]], List[Set[str]]]:
+- validate_and_parse(source) ->
+        Tuple[bool, Union[Tuple[List[str], List[Tuple[str]], List[Tuple[str]]], str]]:
+    validates the structure and extracts the parsed lists in one pass.
+- read_file(source) -> Tuple[List[str], List[Tuple[str]], List[Tuple[str]]]:
     reads an Excel file containing the names of people and their compatibility constraints.
-- process_file(file_path: str) -> 
-        Tuple[bool, Union[Dict[str, Union[Set[str], List[Set[str]]]], str]]:
+- process_file(source) ->
+        Tuple[bool, Union[Dict[str, Union[List[str], List[Tuple[str]]]], str]]:
     processes an Excel file containing the names of people and their compatibility constraints.
 - write_file(file_path: str, display_dictionary: Dict[str, Dict[str, str]]) -> None:
     writes the seating arrangement to an Excel file.
+- write_bytes(display_dictionary: Dict[str, Dict[str, str]]) -> bytes:
+    serializes the seating arrangement to Excel workbook bytes.
+
+The reading functions go straight to openpyxl's streaming reader instead
+of pandas: for a three-column roster the DataFrame machinery (dtype
+inference, block manager) costs far more than the actual parse, and the
+streaming reader keeps memory constant in the row count.
 """
 
-from typing import Dict, List, Tuple, Union
-import pandas as pd
+from functools import lru_cache
+from io import BytesIO
+from typing import IO, Dict, List, Optional, Tuple, Union
+
+import xlsxwriter
+from openpyxl import load_workbook
+
+# Pair separators for the compatible and incompatible columns.
+_COMP_SEP = ':'
+_INC_SEP = '/'
 
+# A parsed worksheet: the header cells and the data rows below them.
+ParsedSheet = Tuple[List[str], List[Tuple[Optional[str], ...]]]
 
+# Accepted inputs for the reading functions: a file path, a binary
+# file-like object, or the result of a previous _load_rows call.
+Source = Union[str, IO[bytes], ParsedSheet]
+
+
+def _load_rows(source: Source) -> ParsedSheet:
+    """
+    Streams the first worksheet of the Excel file into a header list and
+    a list of row tuples, or returns the sheet unchanged if it is already
+    parsed. This lets process_file parse the workbook a single time and
+    share the result between validation and extraction.
+
+    Parameters:
+    -----------
+    source : Source
+        A file path, a binary file-like object, or an already-parsed sheet.
+
+    Returns:
+    --------
+    ParsedSheet
+        The header cells and the data rows of the first worksheet.
+    """
+    if isinstance(source, tuple):
+        return source
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows_iter = workbook.active.iter_rows(values_only=True)
+        header = next(rows_iter, None)
+        return list(header or ()), list(rows_iter)
+    finally:
+        workbook.close()
+
+
+@lru_cache(maxsize=1024)
 def is_excel_file(file_path: str) -> bool:
     """
     Checks if the file at the given path is an Excel file.
+    A pure string predicate, so repeat checks of the same path are
+    served from a small memo cache.
 
     Parameters:
     -----------
@@ -33,71 +89,99 @@ def is_excel_file(file_path: str) -> bool:
     bool
         True if the file is an Excel file, False otherwise.
     """
-    return file_path.endswith('.xlsx')
+    return file_path.lower().endswith('.xlsx')
+
+
+def validate_and_parse(source: Source) -> \
+        Tuple[bool, Union[Tuple[List[str], List[Tuple[str]], List[Tuple[str]]], str]]:
+    """
+    Validates the sheet structure and extracts the person names and the
+    compatibility tuples in a single pass over the rows, instead of
+    walking them once for validation and again for extraction.
 
+    Parameters:
+    -----------
+    source : Source
+        The path to the Excel file, a binary file-like object,
+        or an already-parsed sheet.
 
-def has_valid_structure(file_path: str) -> bool:
+    Returns:
+    --------
+    Tuple[bool, Union[Tuple[List[str], List[Tuple[str]], List[Tuple[str]]], str]]
+        (True, (person_names, compatible_tuples, incompatible_tuples)) if
+        the sheet is valid, (False, reason) otherwise.
+    """
+    invalid = "The Excel file does not have a valid structure."
+    header, rows = _load_rows(source)
+    # Check if the sheet has 3 columns with the correct names
+    if header != ['name', 'compatible', 'incompatible']:
+        return False, invalid
+    # Validate and extract every row in a single pass
+    names = set()
+    person_names = []
+    compatible_tuples = []
+    incompatible_tuples = []
+    pair_names = []
+    for name, compatible, incompatible in rows:
+        # All non-null values must be strings
+        for value in (name, compatible, incompatible):
+            if value is not None and not isinstance(value, str):
+                return False, invalid
+        # The stripped values are both validated and returned, so the
+        # names handed to the solver are exactly the ones checked here.
+        if name is not None:
+            stripped = name.strip()
+            names.add(stripped)
+            person_names.append(stripped)
+        # Each compatible value must have the format 'name:name'.
+        # str.count scans the cell in C without allocating the split
+        # list just to measure its length.
+        if compatible is not None:
+            stripped = compatible.strip()
+            if stripped.count(_COMP_SEP) != 1:
+                return False, invalid
+            pair = tuple(part.strip()
+                         for part in stripped.split(_COMP_SEP))
+            pair_names.extend(pair)
+            compatible_tuples.append(pair)
+        # Each incompatible value must have the format 'name/name'
+        if incompatible is not None:
+            stripped = incompatible.strip()
+            if stripped.count(_INC_SEP) != 1:
+                return False, invalid
+            pair = tuple(part.strip()
+                         for part in stripped.split(_INC_SEP))
+            pair_names.extend(pair)
+            incompatible_tuples.append(pair)
+    # There must be at least one name, without duplicates
+    if not names or len(names) != len(person_names):
+        return False, invalid
+    # All names in the pair columns must be in the name column
+    if not all(name in names for name in pair_names):
+        return False, invalid
+    return True, (person_names, compatible_tuples, incompatible_tuples)
+
+
+def has_valid_structure(source: Source) -> bool:
     """
     Checks if the Excel file has a valid structure for seating arrangement.
 
     Parameters:
     -----------
-    file_path : str
-        The path to the Excel file.
+    source : Source
+        The path to the Excel file, a binary file-like object,
+        or an already-parsed sheet.
 
     Returns:
     --------
     bool
         True if the Excel file has a valid structure, False otherwise.
     """
-    df = pd.read_excel(file_path)
-    # Check if the dataframe has 3 columns
-    if df.shape[1] != 3:
-        return False
-    # Check if the columns have the correct names
-    if any(
-        (df.columns[0] != 'name',
-         df.columns[1] != 'compatible',
-         df.columns[2] != 'incompatible')):
-        return False
-    # Check if the first column has at least one non-null value
-    if not any(df.iloc[:, 0].notnull()):
-        return False
-    # Check if all non-null values in the whole dataframe are strings
-    non_null_values = df.iloc[:, :].values.flatten(
-    )[df.iloc[:, :].notnull().values.flatten()]
-    if not all((isinstance(value, str) for value in non_null_values)):
-        return False
-    # Remove trailing and leading whitespaces from the strings
-    df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-    # Check if the names in the first column are unique
-    if len(df.iloc[:, 0].dropna().unique()) != df.iloc[:, 0].dropna().shape[0]:
-        return False
-    # Check if each non-null value in the second column has the format 'name:name'
-    if not all(df.iloc[:, 1][df.iloc[:, 1].notnull()].apply(
-            lambda x: len(x.split(':')) == 2).tolist()):
-        return False
-    # Check if each non-null value in the third column has the format 'name/name'
-    if not all(df.iloc[:, 2][df.iloc[:, 2].notnull()].apply(
-            lambda x: len(x.split('/')) == 2).tolist()):
-        return False
-    # Set of all names in the first column
-    names = set(df.iloc[:, 0].dropna())
-    # List of all pairs of names in the second column
-    compatible_pairs = df.iloc[:, 1][df.iloc[:, 1].notnull()].apply(
-        lambda x: set(x.split(':'))).tolist()
-    compatible_names = [name for pair in compatible_pairs for name in pair]
-    # List of all pairs of names in the third column
-    incompatible_pairs = df.iloc[:, 2][df.iloc[:, 2].notnull()].apply(
-        lambda x: set(x.split('/'))).tolist()
-    incompatible_names = [name for pair in incompatible_pairs for name in pair]
-    # Check if all names in the second and third columns are in the first column
-    if not all(name in names for name in compatible_names + incompatible_names):
-        return False
-    return True
-
-
-def read_file(file_path: str) -> Tuple[List[str], List[Tuple[str]], List[Tuple[str]]]:
+    return validate_and_parse(source)[0]
+
+
+def read_file(source: Source) -> \
+        Tuple[List[str], List[Tuple[str]], List[Tuple[str]]]:
     """
     Reads an Excel file containing the names of people and their compatibility constraints.
     Returns a tuple containing the list of person names, the list of compatible tuples,
@@ -105,8 +189,9 @@ def read_file(file_path: str) -> Tuple[List[str], List[Tuple[str]], List[Tuple[s
 
     Parameters:
     -----------
-    file_path : str
-        The path to the Excel file to read.
+    source : Source
+        The path to the Excel file, a binary file-like object,
+        or an already-parsed sheet.
 
     Returns:
     --------
@@ -114,41 +199,51 @@ def read_file(file_path: str) -> Tuple[List[str], List[Tuple[str]], List[Tuple[s
         A tuple containing the list of person names, the list of compatible tuples,
         and the list of incompatible tuples.
     """
-    df = pd.read_excel(file_path)
-    # Get the list of person names from the first column of the dataframe
-    person_names = df.iloc[:, 0][df.iloc[:, 0].notnull()].tolist()
-    # Get list of compatible tuples from the second column of the dataframe
-    compatible_tuples = df.iloc[:, 1][df.iloc[:, 1].notnull()].apply(
-        lambda x: tuple(x.split(':'))).tolist()
-    # Get list of incompatible pairs from the third column of the dataframe
-    incompatible_tuples = df.iloc[:, 2][df.iloc[:, 2].notnull()].apply(
-        lambda x: tuple(x.split('/'))).tolist()
+    _, rows = _load_rows(source)
+    person_names = []
+    compatible_tuples = []
+    incompatible_tuples = []
+    for name, compatible, incompatible in rows:
+        # Strip the cells the same way validate_and_parse does, so both
+        # readers hand out identical values for the same workbook.
+        if name is not None:
+            person_names.append(name.strip())
+        if compatible is not None:
+            compatible_tuples.append(tuple(
+                part.strip() for part in compatible.split(_COMP_SEP)))
+        if incompatible is not None:
+            incompatible_tuples.append(tuple(
+                part.strip() for part in incompatible.split(_INC_SEP)))
     return person_names, compatible_tuples, incompatible_tuples
 
 
-def process_file(file_path: str) -> \
+def process_file(source: Union[str, IO[bytes]]) -> \
         Tuple[bool, Union[Dict[str, Union[List[str], List[Tuple[str]]]], str]]:
     """
     Processes an Excel file containing the names of people and their compatibility constraints.
     Returns a tuple containing a boolean indicating if the file was processed successfully
     and a dictionary containing the person names, compatible pairs, and incompatible pairs.
 
+    The workbook is parsed a single time and validation and extraction
+    share the same pass over the rows via validate_and_parse.
+
     Parameters:
     -----------
-    file_path : str
-        The path to the Excel file to process.
-    
+    source : Union[str, IO[bytes]]
+        The path to the Excel file to process, or a binary file-like object.
+
     Returns:
     --------
-    Tuple[bool, Union[Dict[str, Union[Set[str], List[Set[str]]]], str]]
+    Tuple[bool, Union[Dict[str, Union[List[str], List[Tuple[str]]]], str]]
         A tuple containing a boolean indicating if the file was processed successfully
         and a dictionary containing the person names, compatible pairs, and incompatible pairs.
     """
-    if not is_excel_file(file_path):
+    if isinstance(source, str) and not is_excel_file(source):
         return False, "The file is not an Excel file."
-    if not has_valid_structure(file_path):
-        return False, "The Excel file does not have a valid structure."
-    person_names, compatible_tuples, incompatible_tuples = read_file(file_path)
+    success, payload = validate_and_parse(source)
+    if not success:
+        return False, payload
+    person_names, compatible_tuples, incompatible_tuples = payload
     return True, {
         "person_names": person_names,
         "compatible_tuples": compatible_tuples,
@@ -171,6 +266,46 @@ def write_file(file_path: str, display_dictionary: Dict[str, Dict[str, str]]) ->
     --------
     None
     """
-    df = pd.DataFrame({key: list(value.values())
-                      for key, value in display_dictionary.items()})
-    df.to_excel(file_path, index=False)
+    # xlsxwriter is the faster writer, and constant_memory mode flushes
+    # each row as it is written, so memory stays flat in the row count.
+    # Rows must be written in order for that mode, which the seat grid
+    # naturally satisfies.
+    workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True})
+    _write_grid(workbook, display_dictionary)
+    workbook.close()
+
+
+def write_bytes(display_dictionary: Dict[str, Dict[str, str]]) -> bytes:
+    """
+    Serializes the seating arrangement to Excel workbook bytes, for
+    responses that ship the workbook inline instead of via a file.
+
+    Parameters:
+    -----------
+    display_dictionary : Dict[str, Dict[str, str]]
+        A dictionary representing the seating arrangement in the open space.
+
+    Returns:
+    --------
+    bytes
+        The seating arrangement as an .xlsx workbook.
+    """
+    buffer = BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"in_memory": True})
+    _write_grid(workbook, display_dictionary)
+    workbook.close()
+    return buffer.getvalue()
+
+
+def _write_grid(workbook: "xlsxwriter.Workbook",
+                display_dictionary: Dict[str, Dict[str, str]]) -> None:
+    """
+    Writes the seat-by-table grid of the display dictionary into a
+    worksheet of the given workbook, one streamed row at a time.
+    """
+    worksheet = workbook.add_worksheet()
+    worksheet.write_row(0, 0, list(display_dictionary))
+    for row_number, row in enumerate(
+            zip(*(seats.values() for seats in display_dictionary.values())),
+            start=1):
+        worksheet.write_row(row_number, 0, row)
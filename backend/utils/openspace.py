@@ -5,7 +5,7 @@ Description:
 """
 
 from typing import List, Dict
-from random import sample
+from random import shuffle
 
 from utils.table import Table
 
@@ -35,6 +35,13 @@ class Openspace:
         self.table_capacity = table_capacity
         self.tables = [Table(table_id=i, capacity=self.table_capacity)
                        for i in range(1, self.num_tables + 1)]
+        # Fixed for the lifetime of the open space; computed once so the
+        # capacity pre-check in organize_seating is a plain read.
+        self._total_capacity = num_tables * table_capacity
+        # Seat labels are identical for every table; format them once
+        # instead of num_tables times per display_seating call.
+        self._seat_labels = tuple(
+            f"Seat_{number}" for number in range(1, table_capacity + 1))
 
     def organize_seating(
             self,
@@ -54,15 +61,22 @@ class Openspace:
         """
         if len(partition) > self.num_tables:
             raise ValueError("The number of groups exceeds the number of tables.")
-        if any(len(group) > self.table_capacity for group in partition):
-            raise ValueError("A group exceeds the table capacity.")
-        if sum(len(group) for group in partition) > self.num_tables * self.table_capacity:
+        # Gather the group sizes in one pass; the total head count is
+        # checked first, so a hopeless partition fails on simple
+        # arithmetic before any per-group inspection.
+        group_sizes = [len(group) for group in partition]
+        if sum(group_sizes) > self._total_capacity:
             raise ValueError("The total number of people exceeds the total seating capacity.")
+        if any(size > self.table_capacity for size in group_sizes):
+            raise ValueError("A group exceeds the table capacity.")
 
-        shuffle_tables = sample(self.tables, len(self.tables))
+        # Shuffle a small index array in place instead of sampling a fresh
+        # permutation of the table objects.
+        indices = list(range(self.num_tables))
+        shuffle(indices)
         # Assign each group to a table
-        for table, group in zip(shuffle_tables, partition):
-            table.set_occupants(group)
+        for index, group in zip(indices, partition):
+            self.tables[index].set_occupants(group)
 
     def display_seating(self) -> Dict[str, Dict[str, str]]:
         """
@@ -72,14 +86,17 @@ class Openspace:
           Dict[str, Dict[str, str]]: Keys are table identifiers and values are
           dictionaries mapping seat numbers to occupant names.
         """
+        # Seats fill left to right, so table.occupants already is the
+        # occupant column in seat order; reading it avoids touching the
+        # per-seat objects and the two temporary lists per table.
         display_dictionary = {}
         for table in self.tables:
-            seat_names = [f"Seat_{seat.seat_id[1]}" for seat in table.seats]
-            occupants = [
-                '' if seat.occupied_by is None else seat.occupied_by for seat in table.seats
-            ]
+            occupants = table.occupants + \
+                [''] * (table.capacity - len(table.occupants))
+            # dict(zip(...)) pairs the cached labels with the occupants
+            # entirely in C, with no per-seat formatting.
             display_dictionary[f"Table_{table.table_id}"] = dict(
-                zip(seat_names, occupants))
+                zip(self._seat_labels, occupants))
         return display_dictionary
 
     def __repr__(self):
@@ -6,7 +6,10 @@ The function uses the Google OR-Tools CP-SAT solver to find a solution
 that satisfies the constraints.
 """
 
-from typing import List, Tuple
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
 from ortools.sat.python import cp_model
 
 
@@ -14,7 +17,10 @@ def partition_people(
         person_names: List[str],
         compatible_pairs: List[Tuple[str, str]],
         incompatible_pairs: List[Tuple[str, str]],
-        capacity: int
+        capacity: int,
+        max_time_in_seconds: float = 30.0,
+        num_workers: Optional[int] = None,
+        previous_assignment: Optional[Dict[str, int]] = None
 ) -> List[List[str]]:
     """
     Partitions people into groups according to compatibility constraints.
@@ -28,59 +34,165 @@ def partition_people(
         Pairs of people who should not be in the same group.
     capacity : int
         The maximum number of people in each group.
+    max_time_in_seconds : float
+        Time budget for the solver, so hard instances return promptly.
+    num_workers : Optional[int]
+        Number of parallel search workers; defaults to the CPU count.
+    previous_assignment : Optional[Dict[str, int]]
+        A person-to-group mapping from an earlier solve, used as a
+        solution hint so re-solves after small constraint tweaks start
+        from the old arrangement instead of from scratch.
    
     Returns:
     --------
     List[List[str]]
         A list of groups of people that satisfy the constraints
         or an empty list if no solution is found.
+
+    Raises:
+    - ValueError: if a constraint pair names a person missing from
+      person_names.
     """
-    # Create a CP-SAT model
-    model = cp_model.CpModel()
+    # Canonicalize the pair inputs once: a compatible self-pair carries
+    # no information and duplicates would each get their own propagator
+    # in the model.
+    comp = {frozenset(pair) for pair in compatible_pairs
+            if len(set(pair)) == 2}
+    incomp = {frozenset(pair) for pair in incompatible_pairs}
+    # Every constrained name must come from the roster; report bad input
+    # as a ValueError here rather than letting the lookups below leak a
+    # KeyError.
+    known = set(person_names)
+    for pair in comp | incomp:
+        for name in pair:
+            if name not in known:
+                raise ValueError(
+                    f"Constraint pair references an unknown person: {name}")
+    # An incompatible self-pair separates a person from themselves, which
+    # no assignment can satisfy.
+    if any(len(pair) == 1 for pair in incomp):
+        return []
+    # A pair listed as both compatible and incompatible can never be
+    # satisfied; fail before building any model.
+    if comp & incomp:
+        return []
+
+    # Collapse each compatible clique to a spanning tree with union-find:
+    # k mutually compatible people need k-1 equality constraints, not the
+    # O(k^2) pairs a clustered input may list.
+    parent = {name: name for name in person_names}
+
+    def find(name: str) -> str:
+        root = name
+        while parent[root] != root:
+            root = parent[root]
+        while parent[name] != root:
+            parent[name], name = root, parent[name]
+        return root
+
+    spanning_pairs = []
+    for pair in comp:
+        person1, person2 = pair
+        root1, root2 = find(person1), find(person2)
+        if root1 != root2:
+            parent[root2] = root1
+            spanning_pairs.append((person1, person2))
+    compatible_pairs = spanning_pairs
+    incompatible_pairs = [tuple(pair) for pair in incomp]
+
+    # An incompatible pair inside one compatible clique is a transitive
+    # contradiction; reject it without invoking the solver.
+    if any(find(person1) == find(person2)
+           for person1, person2 in incompatible_pairs):
+        return []
+
     num_people = len(person_names)
-    num_groups = num_people // capacity + (1 if num_people % capacity else 0)
+    # Branchless ceiling division
+    num_groups = -(-num_people // capacity)
 
-    # Create a variable for each person representing the group they belong to
-    people = [model.NewIntVar(
-        0, num_groups - 1, f"person_{i}") for i in range(num_people)]
+    # Pigeonhole gates: a compatible clique larger than one table, or any
+    # incompatibility when only one group exists, can never be satisfied;
+    # skip the solver (and its presolve) for such hopeless inputs.
+    clique_sizes = Counter(find(name) for name in person_names)
+    if clique_sizes and max(clique_sizes.values()) > capacity:
+        return []
+    if num_groups == 1 and incompatible_pairs:
+        return []
 
-    # Add constraints for compatible pairs
-    for person1, person2 in compatible_pairs:
-        model.Add(people[person_names.index(person1)] ==
-                  people[person_names.index(person2)])
+    # Create a CP-SAT model
+    model = cp_model.CpModel()
 
-    # Add constraints for incompatible pairs
-    for person1, person2 in incompatible_pairs:
-        model.Add(people[person_names.index(person1)] !=
-                  people[person_names.index(person2)])
+    # Map each name to its index once; list.index would rescan the whole
+    # name list for every constraint pair.
+    idx = {name: i for i, name in enumerate(person_names)}
 
-    # Indicator variables for group membership and enforce group sizes
+    # Boolean indicator variables fully encode the assignment:
+    # is_in_group[i][g] is true iff person i sits in group g. The integer
+    # group variables they used to channel into were redundant and their
+    # propagators dominated presolve time.
     is_in_group = [[model.NewBoolVar(f"is_{person}_in_group_{group}") \
          for group in range(num_groups)] for person in person_names]
 
     # Each person must be in exactly one group
     for i, person in enumerate(person_names):
-        model.Add(sum(is_in_group[i]) == 1)
-        # Link the indicator variables to the people variables
+        model.AddExactlyOne(is_in_group[i])
+
+    # Compatible pairs must agree on every group indicator. The indicator
+    # rows are resolved once per pair rather than once per pair and group.
+    for person1, person2 in compatible_pairs:
+        row1, row2 = is_in_group[idx[person1]], is_in_group[idx[person2]]
+        for group in range(num_groups):
+            model.Add(row1[group] == row2[group])
+
+    # Incompatible pairs must never share a group
+    for person1, person2 in incompatible_pairs:
+        row1, row2 = is_in_group[idx[person1]], is_in_group[idx[person2]]
         for group in range(num_groups):
-            model.Add(people[i] == group).OnlyEnforceIf(is_in_group[i][group])
-            model.Add(people[i] != group).OnlyEnforceIf(
-                is_in_group[i][group].Not())
+            model.AddBoolOr([row1[group].Not(), row2[group].Not()])
+
+    # Break the group-relabeling symmetry: person i may only sit in one of
+    # the first i+1 groups. Any solution can be relabeled to satisfy this
+    # (order groups by first occurrence), so only one representative per
+    # G!-sized equivalence class remains in the search tree.
+    for i in range(min(num_people, num_groups)):
+        for group in range(i + 1, num_groups):
+            model.Add(is_in_group[i][group] == 0)
 
-    # Each group must have at least one person and not exceed capacity
+    # Each group must have at least one person and not exceed capacity.
+    # AddAtLeastOne and LinearExpr.Sum hand the whole column to the C++
+    # layer in one call instead of building the sum term by term in Python.
     for group in range(num_groups):
         group_members = [is_in_group[i][group] for i in range(num_people)]
-        model.Add(sum(group_members) >= 1)
-        model.Add(sum(group_members) <= capacity)
+        model.AddAtLeastOne(group_members)
+        model.Add(cp_model.LinearExpr.Sum(group_members) <= capacity)
+
+    # Warm-start from a previous arrangement when one is supplied; hints
+    # are advisory, so a stale or partly infeasible mapping only guides
+    # the search and never excludes solutions.
+    if previous_assignment:
+        for name, group in previous_assignment.items():
+            if name in idx and 0 <= group < num_groups:
+                model.AddHint(is_in_group[idx[name]][group], 1)
 
     solver = cp_model.CpSolver()
+    # CP-SAT's portfolio search runs diverse strategies in parallel, which
+    # is the main speed knob on hard instances; the time limit keeps the
+    # endpoint responsive when the model is (near-)infeasible.
+    solver.parameters.num_search_workers = num_workers or os.cpu_count() or 8
+    solver.parameters.max_time_in_seconds = max_time_in_seconds
     status = solver.Solve(model)
 
     if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        # Pull the whole solution vector once instead of one
+        # solver.Value round-trip per indicator variable.
+        solution = solver.ResponseProto().solution
         groups = [[] for _ in range(num_groups)]
         for i, person in enumerate(person_names):
-            assigned_group = solver.Value(people[i])
-            groups[assigned_group].append(person)
+            row = is_in_group[i]
+            for group in range(num_groups):
+                if solution[row[group].Index()]:
+                    groups[group].append(person)
+                    break
         # Remove any empty groups
         return [group for group in groups if group]
     else:
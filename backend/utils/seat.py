@@ -45,6 +45,10 @@ class Seat:
     Seat(seat_id=(1, 1), occupied_by=None)
     """
 
+    # No per-instance __dict__: each seat only ever carries these two
+    # fields, so slots cut the instance size and speed up attribute reads.
+    __slots__ = ('seat_id', 'occupied_by')
+
     def __init__(self, seat_id: Tuple[int, int], occupied_by: Optional[str] = None):
         if not (isinstance(seat_id, tuple) and
                 len(seat_id) == 2 and all(isinstance(i, int) for i in seat_id)):
@@ -5,7 +5,7 @@ Description:
 """
 
 
-from typing import List
+from typing import List, Optional
 
 from utils.seat import Seat
 
@@ -17,7 +17,8 @@ class Table:
     Attributes:
     - table_id (int): the table's id.
     - capacity (int): the number of seats at the table.
-    - seats (List[Seat]): a list of Seat objects representing the table's seats.
+    - seats (List[Seat]): a list of Seat objects representing the table's seats,
+      synthesized on demand from the occupant names.
     - occupants (List[str]): a list of the names of the people occupying the table's seats.
 
     Methods:
@@ -94,12 +95,46 @@ class Table:
     ValueError: Not enough free seats at table 2!
     """
 
+    # No per-instance __dict__; the seats property lives on the class, so
+    # it needs no slot.
+    __slots__ = ('table_id', 'capacity', '_occupants', 'occupants',
+                 '_next_free', '_free_count')
+
     def __init__(self, table_id: int, capacity: int):
         self.table_id = table_id
         self.capacity = capacity
-        self.seats = [Seat(seat_id=(table_id, i))
-                      for i in range(1, capacity + 1)]
+        # One occupant slot per seat instead of one Seat object per seat:
+        # the per-seat data is just a name, so a flat list cuts the
+        # allocations and the GC pressure of capacity tiny objects.
+        self._occupants: List[Optional[str]] = [None] * capacity
         self.occupants = []
+        # Index of the next free seat; seats fill left to right, so this
+        # acts as a freelist pointer and placement stays O(1).
+        self._next_free = 0
+        # Number of free seats, maintained by set_occupant so that
+        # left_capacity and has_free_seats are attribute reads instead of
+        # O(capacity) scans over the seats.
+        self._free_count = capacity
+
+    @property
+    def seats(self) -> List[Seat]:
+        """
+        Synthesizes the Seat objects for the table's seats on demand, so
+        callers that want the object view still get one while the hot
+        placement path only touches the flat occupant list.
+
+        Returns:
+        --------
+        List[Seat]
+            A list of Seat objects representing the table's seats.
+        """
+        seats = []
+        for number, name in enumerate(self._occupants, start=1):
+            seat = Seat(seat_id=(self.table_id, number))
+            if name is not None:
+                seat.set_occupant(name)
+            seats.append(seat)
+        return seats
 
     def left_capacity(self) -> int:
         """
@@ -110,7 +145,7 @@ class Table:
         int
             The number of free seats at the table.
         """
-        return sum(seat.occupied_by is None for seat in self.seats)
+        return self._free_count
 
     def has_free_seats(self) -> bool:
         """
@@ -121,7 +156,7 @@ class Table:
         bool
             True if there are free seats at the table, False otherwise.
         """
-        return any(seat.occupied_by is None for seat in self.seats)
+        return self._free_count > 0
 
     def set_occupant(self, person_name: str):
         """
@@ -139,13 +174,30 @@ class Table:
         --------
         None
         """
-        free_seats = [seat for seat in self.seats if seat.occupied_by is None]
-        if free_seats:
-            free_seats[0].set_occupant(person_name)
+        if self._next_free < self.capacity:
+            self._occupants[self._next_free] = person_name
+            self._next_free += 1
+            self._free_count -= 1
             self.occupants.append(person_name)
         else:
             raise ValueError(f"Table {self.table_id} is already full!")
 
+    def _reset(self) -> None:
+        """
+        Clears all occupants, returning the table to its freshly
+        constructed state so callers can reuse the instance instead of
+        allocating a new one.
+
+        Returns:
+        --------
+        None
+        """
+        for i in range(self._next_free):
+            self._occupants[i] = None
+        self.occupants.clear()
+        self._next_free = 0
+        self._free_count = self.capacity
+
     def set_occupants(self, person_names: List[str]):
         """
         Sets the table's next free seats' occupants to person_names.
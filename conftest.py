@@ -0,0 +1,14 @@
+"""
+Pytest bootstrap for running the suite from the project root.
+
+The backend modules import each other as `utils.*` (the package layout
+they see when uvicorn runs from `backend/`), so the backend directory
+must be on sys.path for the tests to import them. Prepending it here
+lets the documented `python -m pytest tests/` invocation work without
+setting PYTHONPATH by hand.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "backend"))
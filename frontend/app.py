@@ -16,13 +16,15 @@ To run the Streamlit app, execute the following command from the `frontend` dire
 """
 
 
+import base64
 import io
 import os
 
-import pandas as pd
 import streamlit as st
-import requests
-from streamlit.components.v1 import html
+
+# pandas and requests are imported lazily inside the functions and the
+# tool branch that need them: the help page then renders without paying
+# for the pandas C-extension load on a cold start.
 
 
 # Get the FastAPI base URL from the environment variable or use the default value
@@ -69,19 +71,111 @@ st.markdown(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def get_session() -> "requests.Session":
+    """
+    Builds the shared HTTP session on first use.
+
+    Keep-alive reuses the TCP connection to the backend across Streamlit
+    reruns instead of paying a fresh handshake per call, and transient
+    connection errors get a short retry.
+    """
+    import requests
+
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=16,
+        max_retries=requests.adapters.Retry(total=2, backoff_factor=0.2)))
+    return session
+
+
+@st.cache_data(persist="disk", ttl=3600, show_spinner=False)
+def fetch_seating(session_id: str) -> bytes:
+    """
+    Fetches the seating workbook for a session from the backend.
+
+    A session's plan never changes once stored, so the bytes are cached
+    to disk: reruns and reopened browser sessions with the same
+    session_id skip the HTTP round-trip entirely for an hour.
+    """
+    import requests
+
+    response = get_session().get(
+        f"{FAST_API_BASE_URL}/download/",
+        params={'session_id': session_id},
+        timeout=30
+    )
+    response.raise_for_status()
+    if response.status_code != 200:
+        raise requests.exceptions.HTTPError(
+            f"Unexpected status {response.status_code} from /download/")
+    return response.content
+
+
+@st.cache_data(show_spinner=False)
+def load_excel(raw: bytes) -> "pd.DataFrame":
+    """
+    Parses the uploaded workbook into the preview DataFrame.
+
+    Streamlit re-executes this script on every widget interaction, so the
+    parse is cached on the file's bytes: re-runs with the same upload are
+    served from cache instead of re-parsing the Excel each time.
+    """
+    import pandas as pd
+
+    # read_only streams the worksheet instead of loading the whole
+    # workbook tree into memory; usecols plus dtype=str skips pandas'
+    # type-inference scan over columns that are displayed as text anyway.
+    return pd.read_excel(
+        io.BytesIO(raw),
+        engine="openpyxl",
+        engine_kwargs={"read_only": True, "data_only": True,
+                       "keep_links": False},
+        usecols=["name", "compatible", "incompatible"],
+        dtype=str,
+    ).fillna("").set_index("name")
+
+
+@st.cache_data(show_spinner=False)
+def load_seating(raw: bytes) -> "pd.DataFrame":
+    """
+    Parses the seating workbook returned by the backend into the
+    seat-indexed display DataFrame, cached on the workbook bytes so
+    reruns after widget interactions skip the re-parse.
+    """
+    import pandas as pd
+
+    df_seating = pd.read_excel(io.BytesIO(raw))
+    # Label the index in place: no Python list of strings
+    # and no set_index reshuffle of the frame.
+    df_seating.index = pd.Index(
+        range(1, len(df_seating) + 1),
+        name="Seats").map("Seat {}".format)
+    return df_seating.fillna("")
+
+
+@st.cache_data(show_spinner=False)
+def load_sample_file() -> bytes:
+    """
+    Reads the model workbook from disk once per process; every rerun of
+    the help page serves the cached bytes instead of reopening the file.
+    """
+    with open('files/names.xlsx', 'rb') as file:
+        return file.read()
+
+
 def main():
     """
     Main function for the Streamlit app with a sidebar and two pages.
     """
-    # Add a custom icon at the top
-    html(
+    # Add a custom icon at the top. Plain markdown renders inline,
+    # unlike components.v1.html which bootstraps an iframe per rerun.
+    st.markdown(
         """
-        <div style="text-align: center; padding: 20px;">
-            <i class="fas fa-chairs" style="font-size: 4rem; color: #4CAF50;"></i>
-        </div>
+        <div style="text-align: center; padding: 20px;
+                    font-size: 4rem; color: #4CAF50;">🪑</div>
         """,
-        width=100,
-        height=100,
+        unsafe_allow_html=True,
     )
 
     # Sidebar section selector
@@ -101,16 +195,19 @@ def main():
         - `compatible`: Pairs of compatible persons (two names separated by a colon `:`)
         - `incompatible`: Pairs of incompatible persons (two names separated by a slash `/`)
         """)
-        with open('files/names.xlsx', 'rb') as f:
-            st.download_button(
-                label='⬇️ Download a Model File',
-                data=f,
-                file_name='names.xlsx',
-                mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                key='sample_fileBtn'
-            )
+        st.download_button(
+            label='⬇️ Download a Model File',
+            data=load_sample_file(),
+            file_name='names.xlsx',
+            mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            key='sample_fileBtn'
+        )
 
     elif section == "Seating Arrangement Tool":
+        # Deferred import: the help page never reaches this branch, so
+        # its cold start skips the requests (and pandas) load entirely.
+        import requests
+
         st.title("Seating Arrangement Tool")
         st.write(
             "Upload your Excel file and set the table capacity to generate a seating arrangement.")
@@ -137,13 +234,19 @@ def main():
         if uploaded_file:
             if st.button("Generate Seating", key='generateBtn'):
                 try:
-                    df_uploaded = pd.read_excel(uploaded_file)
-                    df_uploaded = df_uploaded.fillna("")
-                    df_uploaded = df_uploaded.set_index("name")
+                    df_uploaded = load_excel(uploaded_file.getvalue())
                     data = {'table_capacity': table_capacity}
-                    files = {'file': uploaded_file.getvalue()}
+                    # Hand requests the file object itself so the
+                    # multipart body streams from it in chunks instead of
+                    # materializing another copy of the workbook bytes.
+                    uploaded_file.seek(0)
+                    files = {'file': (
+                        uploaded_file.name,
+                        uploaded_file,
+                        'application/vnd.openxmlformats-officedocument'
+                        '.spreadsheetml.sheet')}
                     with st.spinner("Processing your request..."):
-                        response = requests.post(
+                        response = get_session().post(
                             f"{FAST_API_BASE_URL}/upload/",
                             params=data,
                             files=files,
@@ -156,6 +259,11 @@ def main():
                             st.success("Upload successful!")
                             st.session_state['session_id'] = session_id
                             st.session_state['df_uploaded'] = df_uploaded
+                            # The upload response carries the workbook
+                            # inline, sparing the /download/ round-trip.
+                            if result.get('file_b64'):
+                                st.session_state['seating_bytes'] = \
+                                    base64.b64decode(result['file_b64'])
                         else:
                             st.error(
                                 f"Failed: {result.get('message', 'Unknown error')}")
@@ -176,20 +284,17 @@ def main():
         if 'session_id' in st.session_state:
             session_id = st.session_state['session_id']
             try:
-                with st.spinner("Fetching your seating arrangement..."):
-                    response = requests.get(
-                        f"{FAST_API_BASE_URL}/download/",
-                        params={'session_id': session_id},
-                        timeout=30
-                    )
-                if response.status_code == 200:
+                seating_bytes = st.session_state.get('seating_bytes')
+                if seating_bytes is None:
+                    # Fallback for reopened sessions that have a
+                    # session_id but no inline workbook from /upload/;
+                    # the fetch itself is disk-cached by session_id.
+                    with st.spinner("Fetching your seating arrangement..."):
+                        seating_bytes = fetch_seating(session_id)
+                    st.session_state['seating_bytes'] = seating_bytes
+                if seating_bytes is not None:
                     st.success("Seating plan generated successfully!")
-                    seating_file = io.BytesIO(response.content)
-                    df_seating = pd.read_excel(seating_file)
-                    df_seating["Seats"] = [
-                        "Seat " + str(i+1) for i in range(len(df_seating))]
-                    df_seating = df_seating.set_index("Seats")
-                    df_seating = df_seating.fillna("")
+                    df_seating = load_seating(seating_bytes)
                     st.write("Here is your seating arrangement:")
                     col3, col4 = st.columns([2, 1])
                     with col3:
@@ -198,7 +303,7 @@ def main():
                         st.dataframe(st.session_state.get('df_uploaded'))
                     st.download_button(
                         label="⬇️ Download Excel File",
-                        data=response.content,
+                        data=seating_bytes,
                         file_name=f"seating_arrangement_{session_id}.xlsx",
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                         key='downloadBtn'
@@ -208,6 +313,9 @@ def main():
                         "Failed to retrieve your seating plan. Please try again.")
             except requests.exceptions.Timeout:
                 st.error("The request has timed out. Please try again.")
+            except requests.exceptions.HTTPError:
+                st.error(
+                    "Failed to retrieve your seating plan. Please try again.")
             except requests.exceptions.RequestException as e:
                 st.error(f"An error occurred: {str(e)}")
 
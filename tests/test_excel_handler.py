@@ -9,6 +9,7 @@ python -m unittest tests.test_excel_handler
 """
 
 
+import io
 import unittest
 import os
 import tempfile
@@ -52,6 +53,18 @@ class TestExcelUtils(unittest.TestCase):
         self.temp_files.append(file_path)
         return file_path
 
+    @staticmethod
+    def _create_excel_buffer(df: pd.DataFrame) -> io.BytesIO:
+        """
+        Helper method to write a DataFrame to an in-memory Excel buffer.
+        The reading functions accept file-like objects, so these tests
+        skip the filesystem round-trip entirely.
+        """
+        buffer = io.BytesIO()
+        df.to_excel(buffer, index=False)
+        buffer.seek(0)
+        return buffer
+
     def test_is_excel_file(self):
         """
         Test that is_excel_file returns True only for files ending with '.xlsx'.
@@ -70,8 +83,8 @@ class TestExcelUtils(unittest.TestCase):
             "incompatible": ["Alice/Charlie", pd.NA, "Alice/Charlie"]
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
-        self.assertTrue(has_valid_structure(file_path))
+        buffer = self._create_excel_buffer(df)
+        self.assertTrue(has_valid_structure(buffer))
 
     def test_has_valid_structure_invalid_wrong_columns(self):
         """
@@ -83,8 +96,8 @@ class TestExcelUtils(unittest.TestCase):
             # Missing the 'incompatible' column.
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
-        self.assertFalse(has_valid_structure(file_path))
+        buffer = self._create_excel_buffer(df)
+        self.assertFalse(has_valid_structure(buffer))
 
     def test_has_valid_structure_invalid_wrong_column_names(self):
         """
@@ -96,8 +109,8 @@ class TestExcelUtils(unittest.TestCase):
             "Incompatible": ["Alice/Charlie", pd.NA]
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
-        self.assertFalse(has_valid_structure(file_path))
+        buffer = self._create_excel_buffer(df)
+        self.assertFalse(has_valid_structure(buffer))
 
     def test_has_valid_structure_invalid_format_in_columns(self):
         """
@@ -109,8 +122,8 @@ class TestExcelUtils(unittest.TestCase):
             "incompatible": ["Alice/Charlie", pd.NA]
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
-        self.assertFalse(has_valid_structure(file_path))
+        buffer = self._create_excel_buffer(df)
+        self.assertFalse(has_valid_structure(buffer))
 
     def test_read_file(self):
         """
@@ -122,9 +135,9 @@ class TestExcelUtils(unittest.TestCase):
             "incompatible": ["Alice/Charlie", pd.NA, "Alice/Charlie"]
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
+        buffer = self._create_excel_buffer(df)
         person_names, compatible_tuples, incompatible_tuples = read_file(
-            file_path)
+            buffer)
         self.assertCountEqual(person_names, ["Alice", "Bob", "Charlie"])
         self.assertEqual(compatible_tuples, [("Alice", "Bob")])
         self.assertEqual(incompatible_tuples, [
@@ -152,8 +165,8 @@ class TestExcelUtils(unittest.TestCase):
             # Missing the 'incompatible' column.
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
-        success, result = process_file(file_path)
+        buffer = self._create_excel_buffer(df)
+        success, result = process_file(buffer)
         self.assertFalse(success)
         self.assertEqual(
             result, "The Excel file does not have a valid structure.")
@@ -168,8 +181,8 @@ class TestExcelUtils(unittest.TestCase):
             "incompatible": ["Alice/Charlie", pd.NA, "Alice/Charlie"]
         }
         df = pd.DataFrame(data)
-        file_path = self._create_temp_excel_file(df)
-        success, result = process_file(file_path)
+        buffer = self._create_excel_buffer(df)
+        success, result = process_file(buffer)
         self.assertTrue(success)
         expected = {
             "person_names": ["Alice", "Bob", "Charlie"],
@@ -8,27 +8,38 @@ python -m unittest tests.test_openspace
 """
 
 
+import re
 import unittest
 from backend.utils.openspace import Openspace
 
 
+# Compiled once at module scope; each test then matches with a single
+# scan instead of several independent substring searches.
+REPR_PATTERN = re.compile(
+    r"Openspace\(num_tables=\d+, table_capacity=\d+, tables=\[")
+STR_PATTERN = re.compile(r"Table_\d+: Seat_\d+: \w+")
+
+
 class TestOpenspace(unittest.TestCase):
     """
     Test suite for the Openspace class.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # One shared open space for the read-only tests; tests that seat
+        # people build their own instance so the baseline stays pristine.
+        cls.openspace = Openspace(num_tables=3, table_capacity=4)
+
     def test_initialization(self):
         """
         Test that the open space is initialized with the correct number of tables and seats.
         """
-        num_tables = 3
-        table_capacity = 4
-        openspace = Openspace(num_tables, table_capacity)
-        self.assertEqual(len(openspace.tables), num_tables)
-        for i, table in enumerate(openspace.tables, start=1):
+        self.assertEqual(len(self.openspace.tables), 3)
+        for i, table in enumerate(self.openspace.tables, start=1):
             self.assertEqual(table.table_id, i)
-            self.assertEqual(table.capacity, table_capacity)
-            self.assertEqual(len(table.seats), table_capacity)
+            self.assertEqual(table.capacity, 4)
+            self.assertEqual(len(table.seats), 4)
 
     def test_organize_seating_valid(self):
         """
@@ -44,19 +55,17 @@ class TestOpenspace(unittest.TestCase):
         ]
         openspace.organize_seating(partition)
         seating = openspace.display_seating()
-        found_alice_bob = False
-        found_charlie = False
-        # Since the tables might be shuffled, iterate over all to find our groups.
-        for _, seat_map in seating.items():
-            occupants = list(seat_map.values())
-            if occupants.count("Alice") == 1 and occupants.count("Bob") == 1:
-                found_alice_bob = True
-            if occupants.count("Charlie") == 1:
-                found_charlie = True
-        self.assertTrue(found_alice_bob,
-                        "The group ['Alice', 'Bob'] was not seated correctly.")
-        self.assertTrue(
-            found_charlie, "The group ['Charlie'] was not seated correctly.")
+        # The tables might be shuffled, so invert the seating into a
+        # person-to-table map in one pass and assert against that.
+        assignment = {occupant: table_key
+                      for table_key, seat_map in seating.items()
+                      for occupant in seat_map.values() if occupant}
+        self.assertIn("Alice", assignment)
+        self.assertIn("Bob", assignment)
+        self.assertEqual(assignment["Alice"], assignment["Bob"],
+                         "The group ['Alice', 'Bob'] was not seated correctly.")
+        self.assertIn("Charlie", assignment,
+                      "The group ['Charlie'] was not seated correctly.")
 
     def test_invalid_number_of_groups(self):
         """
@@ -91,13 +100,12 @@ class TestOpenspace(unittest.TestCase):
         self.assertEqual(str(cm.exception),
                          "A group exceeds the table capacity.")
 
-    @unittest.skip("Cannot trigger total seating capacity error due to group capacity constraints.")
     def test_total_exceeds_capacity(self):
         """
-        Test that organizing seating fails when the total number of people 
+        Test that organizing seating fails when the total number of people
         exceeds overall seating capacity.
-        Note: This condition is logically unreachable given that each group is
-        individually constrained to not exceed table capacity.
+        The total head count is checked before the per-group sizes, so
+        this error is reachable even when a group is also oversized.
         """
         num_tables = 2
         table_capacity = 4  # Total seats = 8
@@ -137,13 +145,7 @@ class TestOpenspace(unittest.TestCase):
         """
         Test the __repr__ string of the Openspace class.
         """
-        num_tables = 2
-        table_capacity = 3
-        openspace = Openspace(num_tables, table_capacity)
-        rep = repr(openspace)
-        self.assertIn("Openspace(num_tables=", rep)
-        self.assertIn("table_capacity=", rep)
-        self.assertIn("tables=", rep)
+        self.assertRegex(repr(self.openspace), REPR_PATTERN)
 
     def test_str(self):
         """
@@ -157,9 +159,16 @@ class TestOpenspace(unittest.TestCase):
         ]
         openspace.organize_seating(partition)
         s = str(openspace)
-        self.assertIn("Table_", s)
-        self.assertIn("Seat_", s)
+        self.assertRegex(s, STR_PATTERN)
         self.assertIn("Alice", s)
+        # Build every expected token up front and report all absentees in
+        # one go, rather than one assertIn scan per table and seat. With a
+        # single one-person group, one table stays fully empty, so every
+        # "Seat_i: Empty" token appears somewhere in the output.
+        tokens = [f"Table_{i}:" for i in range(1, num_tables + 1)]
+        tokens += [f"Seat_{i}: Empty" for i in range(1, table_capacity + 1)]
+        missing = [token for token in tokens if token not in s]
+        self.assertFalse(missing, f"missing tokens: {missing}")
 
 
 if __name__ == '__main__':
@@ -8,108 +8,123 @@ python -m unittest tests.test_partition
 """
 
 
+import os
 import unittest
-from backend.utils.partition import partition_people
+
+
+# The everyday scenarios stay small and fast; the solver stress test is
+# opt-in so rapid dev loops skip it. Set RUN_SLOW=1 to include it.
+RUN_SLOW = bool(os.environ.get("RUN_SLOW"))
+
+# Shared scenario inputs, built once at import time instead of per run.
+# partition_people only iterates them, so immutable tuples suffice.
+FOUR_PEOPLE = ("Alice", "Bob", "Charlie", "David")
+ALICE_BOB = (("Alice", "Bob"),)
+ALICE_CHARLIE = (("Alice", "Charlie"),)
+NO_PAIRS = ()
 
 
 class TestPartitionPeople(unittest.TestCase):
     """
     Test suite for the partition_people function.
+
+    The scenarios share one driver that runs each case as a subTest,
+    so the per-test fixture overhead is paid once for the whole table
+    instead of once per solver invocation.
     """
 
-    def test_no_constraints(self):
+    @classmethod
+    def setUpClass(cls):
+        # Deferred import: pytest imports every collected test module, so
+        # a top-level import would pull in the OR-Tools solver stack even
+        # for runs that only select the other test files.
+        from backend.utils.partition import partition_people
+        cls.partition_people = staticmethod(partition_people)
+
+    @staticmethod
+    def _group_index(groups):
         """
-        Test partitioning with no compatibility or incompatibility constraints.
+        Builds an inverted index mapping each person to the position of
+        their group, in one pass over the solution.
         """
-        person_names = ["Alice", "Bob", "Charlie", "David"]
-        compatible_pairs = []
-        incompatible_pairs = []
-        capacity = 2
-        groups = partition_people(
-            person_names, compatible_pairs, incompatible_pairs, capacity)
-
-        # Check that all persons appear in some group.
-        grouped_persons = [person for group in groups for person in group]
-        self.assertCountEqual(grouped_persons, person_names)
+        return {person: i
+                for i, group in enumerate(groups) for person in group}
 
-        # Check that no group exceeds the capacity.
+    def _check_no_constraints(self, groups, person_names, capacity):
+        """All persons appear in some group and no group exceeds capacity."""
+        grouped_persons = [person for group in groups for person in group]
+        # Names are unique, so set equality plus a length check covers
+        # membership and duplicates without Counter machinery.
+        self.assertEqual(set(grouped_persons), set(person_names))
+        self.assertEqual(len(grouped_persons), len(person_names))
         for group in groups:
             self.assertLessEqual(len(group), capacity)
 
-    def test_compatible_pairs(self):
-        """Test that people required to be together end up in the same group."""
-        person_names = ["Alice", "Bob", "Charlie", "David"]
-        compatible_pairs = [("Alice", "Bob")]
-        incompatible_pairs = []
-        capacity = 3
-        groups = partition_people(
-            person_names, compatible_pairs, incompatible_pairs, capacity)
-
-        # Find the groups for Alice and Bob.
-        group_alice = group_bob = None
-        for group in groups:
-            if "Alice" in group:
-                group_alice = group
-            if "Bob" in group:
-                group_bob = group
-
-        self.assertIsNotNone(group_alice)
-        self.assertIsNotNone(group_bob)
-        self.assertEqual(group_alice, group_bob,
-                         "Alice and Bob should be in the same group.")
-
-    def test_incompatible_pairs(self):
-        """
-        Test that people required to be separate end up in different groups.
-        """
-        person_names = ["Alice", "Bob", "Charlie", "David"]
-        compatible_pairs = []
-        incompatible_pairs = [("Alice", "Bob")]
-        capacity = 3
-        groups = partition_people(
-            person_names, compatible_pairs, incompatible_pairs, capacity)
-
-        # Find the groups for Alice and Bob.
-        group_alice = group_bob = None
-        for group in groups:
-            if "Alice" in group:
-                group_alice = group
-            if "Bob" in group:
-                group_bob = group
-
-        self.assertIsNotNone(group_alice)
-        self.assertIsNotNone(group_bob)
-        self.assertNotEqual(group_alice, group_bob,
+    def _check_compat_and_incompat(self, groups, _person_names, _capacity):
+        """Both constraint types are honored within a single solve."""
+        where = self._group_index(groups)
+        self.assertIn("Alice", where)
+        self.assertIn("Bob", where)
+        self.assertIn("Charlie", where)
+        self.assertEqual(where["Alice"], where["Charlie"],
+                         "Alice and Charlie should be in the same group.")
+        self.assertNotEqual(where["Alice"], where["Bob"],
                             "Alice and Bob should not be in the same group.")
 
-    def test_unsolvable_constraints(self):
-        """
-        Test that contradictory constraints (being forced to be together and apart)
-        result in no solution.
-        """
-        person_names = ["Alice", "Bob"]
-        compatible_pairs = [("Alice", "Bob")]
-        incompatible_pairs = [("Alice", "Bob")]
-        capacity = 2
-        groups = partition_people(
-            person_names, compatible_pairs, incompatible_pairs, capacity)
+    def _check_unsolvable(self, groups, _person_names, _capacity):
+        """Contradictory constraints result in no solution."""
         self.assertEqual(
             groups, [], "Expected no solution due to contradictory constraints.")
 
-    def test_all_in_one_group(self):
-        """
-        Test that when the capacity is larger than the number of people,
-        all people are grouped together.
-        """
-        person_names = ["Alice", "Bob", "Charlie"]
-        compatible_pairs = []
-        incompatible_pairs = []
-        capacity = 5  # More than the number of persons.
-        groups = partition_people(
-            person_names, compatible_pairs, incompatible_pairs, capacity)
+    def _check_all_in_one_group(self, groups, person_names, _capacity):
+        """When capacity exceeds the head count, one group holds everyone."""
         self.assertEqual(
             len(groups), 1, "All people should be in a single group.")
-        self.assertCountEqual(groups[0], person_names)
+        self.assertEqual(set(groups[0]), set(person_names))
+        self.assertEqual(len(groups[0]), len(person_names))
+
+    def test_partition_scenarios(self):
+        """
+        Run the partitioning scenarios against one table of cases:
+        (scenario, person_names, compatible, incompatible, capacity, check).
+        """
+        cases = [
+            ("no_constraints",
+             FOUR_PEOPLE, NO_PAIRS, NO_PAIRS, 2,
+             self._check_no_constraints),
+            ("compat_and_incompat",
+             FOUR_PEOPLE, ALICE_CHARLIE, ALICE_BOB, 2,
+             self._check_compat_and_incompat),
+            ("unsolvable_constraints",
+             ("Alice", "Bob"), ALICE_BOB, ALICE_BOB, 2,
+             self._check_unsolvable),
+            ("all_in_one_group",
+             ("Alice", "Bob", "Charlie"), NO_PAIRS, NO_PAIRS, 5,
+             self._check_all_in_one_group),
+        ]
+        for scenario, person_names, compatible, incompatible, capacity, check \
+                in cases:
+            with self.subTest(scenario=scenario):
+                groups = self.partition_people(
+                    person_names, compatible, incompatible, capacity)
+                check(groups, person_names, capacity)
+
+    @unittest.skipUnless(RUN_SLOW, "slow solver test; set RUN_SLOW=1")
+    def test_partition_large_scenario(self):
+        """
+        Stress the solver with a larger head count and both constraint
+        types at once. Skipped unless RUN_SLOW=1.
+        """
+        person_names = tuple(f"Person_{i}" for i in range(1, 21))
+        compatible = (("Person_1", "Person_2"),)
+        incompatible = (("Person_3", "Person_4"),)
+        capacity = 4
+        groups = self.partition_people(
+            person_names, compatible, incompatible, capacity)
+        self._check_no_constraints(groups, person_names, capacity)
+        where = self._group_index(groups)
+        self.assertEqual(where["Person_1"], where["Person_2"])
+        self.assertNotEqual(where["Person_3"], where["Person_4"])
 
 
 if __name__ == '__main__':
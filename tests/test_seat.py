@@ -1,94 +1,108 @@
 """
 This is a test suite for the Seat class.
 
-To run this script, run `python -m unittest tests/test_seat.py` from the project root directory.
+To run this script, run `python -m pytest tests/test_seat.py` from the project root directory.
 """
 
-import unittest
+import pytest
 
 from backend.utils.seat import Seat
 
 
-class TestSeat(unittest.TestCase):
-    """Tests for the Seat class."""
-
-    def setUp(self):
-        self.valid_seat_id = (1, 1)
-        self.seat = Seat(self.valid_seat_id)
-
-    def test_initial_state(self):
-        """Test that a new seat is created with the correct initial state."""
-        self.assertEqual(self.seat.seat_id, self.valid_seat_id)
-        self.assertIsNone(self.seat.occupied_by)
-
-    def test_invalid_seat_id(self):
-        """Test that invalid seat_id values raise a TypeError."""
-        with self.assertRaises(TypeError):
-            Seat("invalid")  # Not a tuple
-
-        with self.assertRaises(TypeError):
-            Seat((1, "a"))  # Second element is not an int
-
-        with self.assertRaises(TypeError):
-            Seat((1,))  # Tuple does not have two elements
-
-        with self.assertRaises(TypeError):
-            Seat((1, 2, 3))  # Tuple has too many elements
-
-    def test_set_occupant_success(self):
-        """Test that setting an occupant on an unoccupied seat works correctly."""
-        self.seat.set_occupant("Alice")
-        self.assertEqual(self.seat.occupied_by, "Alice")
-
-    def test_set_occupant_already_occupied(self):
-        """
-        Test that attempting to set an occupant on an already occupied seat raises a ValueError.
-        """
-        self.seat.set_occupant("Alice")
-        with self.assertRaises(ValueError) as context:
-            self.seat.set_occupant("Bob")
-        self.assertIn("already occupied", str(context.exception))
-
-    def test_remove_occupant(self):
-        """
-        Test that remove_occupant returns None when the seat is empty, 
-        and the occupant's name when occupied.
-        """
-        # Removing occupant from an empty seat should return None.
-        self.assertIsNone(self.seat.remove_occupant())
-
-        # Set an occupant and then remove.
-        self.seat.set_occupant("Alice")
-        removed = self.seat.remove_occupant()
-        self.assertEqual(removed, "Alice")
-        self.assertIsNone(self.seat.occupied_by)
-
-    def test_repr(self):
-        """Test that __repr__ returns the expected string representation."""
-        self.assertEqual(
-            repr(self.seat), "Seat(seat_id=(1, 1), occupied_by=None)")
-        self.seat.set_occupant("Alice")
-        # Note: __repr__ does not add extra quotes around string attributes.
-        self.assertEqual(
-            repr(self.seat), "Seat(seat_id=(1, 1), occupied_by=Alice)")
-
-    def test_str(self):
-        """Test that __str__ returns a human-readable string representation."""
-        self.assertEqual(str(self.seat), "Seat (1, 1) is unoccupied.")
-        self.seat.set_occupant("Alice")
-        self.assertEqual(str(self.seat), "Seat (1, 1) is occupied by Alice.")
-
-    def test_equality(self):
-        """Test the __eq__ method for Seat objects."""
-        seat1 = Seat((1, 1), "Alice")
-        seat2 = Seat((1, 1), "Alice")
-        seat3 = Seat((1, 1))
-        seat4 = Seat((2, 1), "Alice")
-
-        self.assertEqual(seat1, seat2)
-        self.assertNotEqual(seat1, seat3)
-        self.assertNotEqual(seat1, seat4)
-
-
-if __name__ == '__main__':
-    unittest.main()
+VALID_SEAT_ID = (1, 1)
+
+# Expected renderings, folded to constants so each assertion
+# compares against an already-built string.
+REPR_EMPTY = "Seat(seat_id=(1, 1), occupied_by=None)"
+REPR_ALICE = "Seat(seat_id=(1, 1), occupied_by=Alice)"
+STR_EMPTY = "Seat (1, 1) is unoccupied."
+STR_ALICE = "Seat (1, 1) is occupied by Alice."
+
+# Every rejected seat_id shape, driven through one parametrized test.
+INVALID_SEAT_IDS = (
+    "invalid",   # Not a tuple
+    (1, "a"),    # Second element is not an int
+    (1,),        # Tuple does not have two elements
+    (1, 2, 3),   # Tuple has too many elements
+)
+
+
+@pytest.fixture(scope="module")
+def pristine_seat():
+    """One pristine seat shared by the tests that never mutate it."""
+    return Seat(VALID_SEAT_ID)
+
+
+@pytest.fixture
+def seat():
+    """A fresh seat for the tests that set or remove occupants."""
+    return Seat(VALID_SEAT_ID)
+
+
+def test_initial_state(pristine_seat):
+    """Test that a new seat is created with the correct initial state."""
+    assert pristine_seat.seat_id == VALID_SEAT_ID
+    assert pristine_seat.occupied_by is None
+
+
+@pytest.mark.parametrize("seat_id", INVALID_SEAT_IDS)
+def test_invalid_seat_id(seat_id):
+    """Test that invalid seat_id values raise a TypeError."""
+    with pytest.raises(TypeError):
+        Seat(seat_id)
+
+
+def test_set_occupant_success(seat):
+    """Test that setting an occupant on an unoccupied seat works correctly."""
+    seat.set_occupant("Alice")
+    assert seat.occupied_by == "Alice"
+
+
+def test_set_occupant_already_occupied(seat):
+    """
+    Test that attempting to set an occupant on an already occupied seat raises a ValueError.
+    """
+    seat.set_occupant("Alice")
+    with pytest.raises(ValueError, match="already occupied"):
+        seat.set_occupant("Bob")
+
+
+def test_remove_occupant(seat):
+    """
+    Test that remove_occupant returns None when the seat is empty,
+    and the occupant's name when occupied.
+    """
+    # Removing occupant from an empty seat should return None.
+    assert seat.remove_occupant() is None
+
+    # Set an occupant and then remove.
+    seat.set_occupant("Alice")
+    assert seat.remove_occupant() == "Alice"
+    assert seat.occupied_by is None
+
+
+def test_repr(seat):
+    """Test that __repr__ returns the expected string representation."""
+    assert repr(seat) == REPR_EMPTY
+    seat.set_occupant("Alice")
+    # Note: __repr__ does not add extra quotes around string attributes.
+    assert repr(seat) == REPR_ALICE
+
+
+def test_str(seat):
+    """Test that __str__ returns a human-readable string representation."""
+    assert str(seat) == STR_EMPTY
+    seat.set_occupant("Alice")
+    assert str(seat) == STR_ALICE
+
+
+def test_equality():
+    """Test the __eq__ method for Seat objects."""
+    seat1 = Seat((1, 1), "Alice")
+    seat2 = Seat((1, 1), "Alice")
+    seat3 = Seat((1, 1))
+    seat4 = Seat((2, 1), "Alice")
+
+    assert seat1 == seat2
+    assert seat1 != seat3
+    assert seat1 != seat4
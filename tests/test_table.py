@@ -11,9 +11,17 @@ from backend.utils.table import Table
 class TestTable(unittest.TestCase):
     """Test the Table class."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Templates shared by all tests; setUp clears their occupants
+        # instead of re-allocating tables for every method.
+        cls._template = Table(table_id=1, capacity=4)
+        cls._template2 = Table(table_id=2, capacity=4)
+
     def setUp(self):
-        # Create a table with table_id=1 and capacity=4 before each test.
-        self.table = Table(table_id=1, capacity=4)
+        # Reuse the table with table_id=1 and capacity=4, emptied out.
+        self.table = self._template
+        self.table._reset()
 
     def test_initial_state(self):
         """Test that a new table is initialized correctly."""
@@ -39,9 +47,9 @@ class TestTable(unittest.TestCase):
 
     def test_set_occupant_full(self):
         """Test that setting an occupant on a full table raises an error."""
-        # Fill the table.
-        for name in ["Alice", "Bob", "Charlie", "David"]:
-            self.table.set_occupant(name)
+        # Fill the table in one batch call; the per-seat path is already
+        # covered by test_set_occupant.
+        self.table.set_occupants(["Alice", "Bob", "Charlie", "David"])
         self.assertEqual(self.table.left_capacity(), 0)
         self.assertFalse(self.table.has_free_seats())
         # Attempting to add another occupant should raise a ValueError.
@@ -52,7 +60,8 @@ class TestTable(unittest.TestCase):
     def test_set_occupants_success(self):
         """Test that setting multiple occupants works correctly."""
         # Use a different table for clarity.
-        table2 = Table(table_id=2, capacity=4)
+        table2 = self._template2
+        table2._reset()
         names = ["Eve", "Frank", "Grace"]
         table2.set_occupants(names)
         # The first three seats should be occupied accordingly.